@@ -16,9 +16,11 @@ from mcp import StdioServerParameters
 
 from .callbacks import LoggingCallbacks, add_session_to_memory
 from .prompt import (
-    return_description_root,
+    DESCRIPTION_ROOT,
+    INSTRUCTION_ROOT,
+    PROMPT_VERSION,
+    return_date_instruction,
     return_global_instruction,
-    return_instruction_root,
 )
 
 logger = logging.getLogger(__name__)
@@ -77,13 +79,18 @@ whatsapp_mcp_toolset = McpToolset(
     ],
 )
 
+logger.info(f"Using prompt version: {PROMPT_VERSION}")
+
 root_agent = LlmAgent(
     name="root_agent",
-    description=return_description_root(),
+    description=DESCRIPTION_ROOT,
     before_agent_callback=logging_callbacks.before_agent,
     after_agent_callback=[logging_callbacks.after_agent, add_session_to_memory],
     model=model,
-    instruction=return_instruction_root(),
+    # Static prompt goes first in the system instruction so providers can cache
+    # it; the dynamic date instruction is sent after it as user content.
+    static_instruction=INSTRUCTION_ROOT,
+    instruction=return_date_instruction,
     tools=[PreloadMemoryTool(), whatsapp_mcp_toolset],
     before_model_callback=logging_callbacks.before_model,
     after_model_callback=logging_callbacks.after_model,
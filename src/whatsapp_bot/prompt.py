@@ -1,20 +1,22 @@
 """Prompt definitions for the WhatsApp reply bot agent."""
 
+import hashlib
+import inspect
+import re
+import sys
 from datetime import date
+from functools import lru_cache
+from typing import Final
 
 from google.adk.agents.readonly_context import ReadonlyContext
 
+# Interned so equality checks against the agent description hit the identity path
+DESCRIPTION_ROOT: Final[str] = sys.intern(
+    "A WhatsApp assistant that reads incoming messages and sends "
+    "helpful replies on behalf of the user"
+)
 
-def return_description_root() -> str:
-    description = (
-        "A WhatsApp assistant that reads incoming messages and sends "
-        "helpful replies on behalf of the user"
-    )
-    return description
-
-
-def return_instruction_root() -> str:
-    instruction = """
+_INSTRUCTION_ROOT_RAW = """
 You are a WhatsApp auto-reply assistant. Your job is to help the user
 manage their personal WhatsApp messages by reading conversations and
 sending replies.
@@ -52,13 +54,56 @@ sending replies.
 - Use compact formatting — bullets and short lines, not long paragraphs.
 </output_format>
 """
-    return instruction
+
+
+def _normalize_prompt(text: str) -> str:
+    """Dedent a prompt and drop trailing whitespace, blank-line runs, and padding."""
+    lines = "\n".join(line.rstrip() for line in inspect.cleandoc(text).splitlines())
+    return re.sub(r"\n{3,}", "\n\n", lines).strip()
+
+
+INSTRUCTION_ROOT: Final[str] = _normalize_prompt(_INSTRUCTION_ROOT_RAW)
+
+
+def return_description_root() -> str:
+    return DESCRIPTION_ROOT
+
+
+def return_instruction_root() -> str:
+    return INSTRUCTION_ROOT
+
+
+_GLOBAL_INSTRUCTION: Final[str] = "You are a WhatsApp auto-reply assistant."
+
+
+def _prompt_version(*parts: str) -> str:
+    """Return a short fingerprint of the given prompt texts."""
+    return hashlib.sha256("\n\n".join(parts).encode()).hexdigest()[:8]
+
+
+# Fingerprint of the prompt text defined here that lands in the cached system
+# instruction: global instruction, agent description (added by ADK's identity
+# processor), and root instruction. The agent name lives in agent.py and is
+# not covered.
+PROMPT_VERSION: Final[str] = _prompt_version(
+    _GLOBAL_INSTRUCTION, DESCRIPTION_ROOT, INSTRUCTION_ROOT
+)
+
+_DATE_INSTRUCTION_PREFIX: Final[str] = "Today's date: "
+
+
+@lru_cache(maxsize=2)
+def _date_instruction_for_day(today: date) -> str:
+    """Format the date instruction once per calendar day."""
+    return _DATE_INSTRUCTION_PREFIX + today.isoformat()
 
 
 def return_global_instruction(ctx: ReadonlyContext) -> str:
-    """Generate global instruction with current date.
+    """Generate the stable global instruction.
 
-    Uses InstructionProvider pattern to ensure date updates at request time.
+    Kept free of volatile values so it forms an unchanging prefix with the
+    agent's static instruction, which lets providers reuse cached prompt
+    prefixes across requests and days.
     GlobalInstructionPlugin expects signature: (ReadonlyContext) -> str
 
     Args:
@@ -66,9 +111,24 @@ def return_global_instruction(ctx: ReadonlyContext) -> str:
              Provides access to session state and metadata for future customization.
 
     Returns:
-        str: Global instruction string with dynamically generated current date.
+        str: Global instruction string identifying the assistant.
+    """
+    return _GLOBAL_INSTRUCTION
+
+
+def return_date_instruction(ctx: ReadonlyContext) -> str:
+    """Generate the dynamic instruction with current date.
+
+    Uses InstructionProvider pattern to ensure date updates at request time.
+    Because the agent also sets a static instruction, ADK sends this after the
+    cacheable system prompt instead of inside it.
+    The formatted string is cached per day, so repeated calls only pay for
+    the date.today() lookup.
+
+    Args:
+        ctx: ReadonlyContext required by the InstructionProvider signature.
+
+    Returns:
+        str: Instruction string with dynamically generated current date.
     """
-    return (
-        f"\n\nYou are a WhatsApp auto-reply assistant.\n"
-        f"Today's date: {date.today()}"
-    )
+    return _date_instruction_for_day(date.today())
@@ -1,7 +1,11 @@
 """Utility modules."""
 
+from typing import TYPE_CHECKING
+
 from .config import ServerEnv, initialize_environment
-from .observability import configure_otel_resource, setup_logging
+
+if TYPE_CHECKING:
+    from .observability import configure_otel_resource, setup_logging
 
 __all__ = [
     "ServerEnv",
@@ -9,3 +13,15 @@ __all__ = [
     "initialize_environment",
     "setup_logging",
 ]
+
+# Observability helpers pull in the OpenTelemetry SDK, so load them on first use
+_LAZY_OBSERVABILITY = frozenset({"configure_otel_resource", "setup_logging"})
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_OBSERVABILITY:
+        from . import observability
+
+        return getattr(observability, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -7,25 +7,21 @@ implementation choices (plugins, tools, etc.).
 Future: Container-based smoke tests for CI/CD will be added here.
 """
 
-from collections.abc import Sequence
-from typing import Any, Protocol, cast
+from collections.abc import Callable
 
-from whatsapp_bot import app
-
-
-class AgentConfigLike(Protocol):
-    """Minimal whatsapp_bot surface needed for integration assertions."""
+import pytest
+from google.adk.agents import LlmAgent
+from google.genai import types
 
-    name: str
-    model: Any
-    instruction: str | None
-    description: str | None
-    tools: Sequence[object] | None
+from whatsapp_bot import app
 
 
-def as_whatsapp_bot_config(whatsapp_bot: object) -> AgentConfigLike:
-    """Treat runtime whatsapp_bot instances as a typed config surface."""
-    return cast(AgentConfigLike, whatsapp_bot)
+@pytest.fixture(scope="module")
+def whatsapp_bot() -> LlmAgent:
+    """Resolve the root whatsapp_bot once for the module."""
+    root_agent = app.root_agent
+    assert isinstance(root_agent, LlmAgent)
+    return root_agent
 
 
 class TestAppIntegration:
@@ -36,11 +32,11 @@ class TestAppIntegration:
         assert app is not None
         assert app.name is not None
         assert isinstance(app.name, str)
-        assert len(app.name) > 0
+        assert app.name
 
     def test_app_has_root_whatsapp_bot(self) -> None:
         """Verify app is wired to root whatsapp_bot."""
-        assert app.root_whatsapp_bot is not None
+        assert app.root_agent is not None
 
     def test_app_plugins_are_valid_if_configured(self) -> None:
         """Verify plugins (if any) are properly initialized."""
@@ -48,62 +44,62 @@ class TestAppIntegration:
         if app.plugins is not None:
             assert isinstance(app.plugins, list)
             # Each plugin should be an object instance
-            for plugin in app.plugins:
-                assert plugin is not None
-                assert hasattr(plugin, "__class__")
+            assert all(plugin is not None for plugin in app.plugins)
 
 
 class TestAgentIntegration:
     """Pattern-based integration tests for Agent configuration."""
 
-    def test_whatsapp_bot_has_required_configuration(self) -> None:
+    def test_whatsapp_bot_has_required_configuration(
+        self, whatsapp_bot: LlmAgent
+    ) -> None:
         """Verify whatsapp_bot has required configuration fields."""
-        whatsapp_bot = app.root_whatsapp_bot
         assert whatsapp_bot is not None
-        typed_whatsapp_bot = as_whatsapp_bot_config(whatsapp_bot)
 
         # Required: whatsapp_bot name
-        assert typed_whatsapp_bot.name is not None
-        assert isinstance(typed_whatsapp_bot.name, str)
-        assert len(typed_whatsapp_bot.name) > 0
+        assert whatsapp_bot.name is not None
+        assert isinstance(whatsapp_bot.name, str)
+        assert whatsapp_bot.name
 
         # Required: whatsapp_bot model
-        assert typed_whatsapp_bot.model is not None
+        model = whatsapp_bot.model
+        assert model is not None
         # model can be a string name or a model object (e.g. LiteLlm)
-        if isinstance(typed_whatsapp_bot.model, str):
-            assert len(typed_whatsapp_bot.model) > 0
+        if isinstance(model, str):
+            assert model
         else:
             # If it's an object, it should have a model attribute that is a string
-            assert hasattr(typed_whatsapp_bot.model, "model")
-            assert isinstance(typed_whatsapp_bot.model.model, str)
-            assert len(typed_whatsapp_bot.model.model) > 0
-
-    def test_whatsapp_bot_instructions_are_valid_if_configured(self) -> None:
-        """Verify whatsapp_bot instructions (if configured) are valid strings."""
-        whatsapp_bot = app.root_whatsapp_bot
-        assert whatsapp_bot is not None
-        typed_whatsapp_bot = as_whatsapp_bot_config(whatsapp_bot)
-
-        # Instruction is optional - if configured, should be non-empty string
-        if typed_whatsapp_bot.instruction is not None:
-            assert isinstance(typed_whatsapp_bot.instruction, str)
-            assert len(typed_whatsapp_bot.instruction) > 0
-
-        # Description is optional - if configured, should be non-empty string
-        if typed_whatsapp_bot.description is not None:
-            assert isinstance(typed_whatsapp_bot.description, str)
-            assert len(typed_whatsapp_bot.description) > 0
-
-    def test_whatsapp_bot_tools_are_valid_if_configured(self) -> None:
-        """Verify whatsapp_bot tools (if any) are properly initialized."""
-        whatsapp_bot = app.root_whatsapp_bot
-        assert whatsapp_bot is not None
-        typed_whatsapp_bot = as_whatsapp_bot_config(whatsapp_bot)
-
-        # Tools are optional - if configured, should be a list
-        if typed_whatsapp_bot.tools is not None:
-            assert isinstance(typed_whatsapp_bot.tools, list)
-            # Each tool should be an object instance
-            for tool in typed_whatsapp_bot.tools:
-                assert tool is not None
-                assert hasattr(tool, "__class__")
+            assert hasattr(model, "model")
+            assert isinstance(model.model, str)
+            assert model.model
+
+    @pytest.mark.parametrize(
+        ("attr", "expected_types", "must_be_non_empty"),
+        [
+            # instruction may be a string or an InstructionProvider callable
+            ("instruction", (str, Callable), True),
+            ("static_instruction", (str, types.Content), True),
+            ("description", (str,), True),
+            # An empty tools list is a valid configuration
+            ("tools", (list,), False),
+        ],
+    )
+    def test_whatsapp_bot_field_is_valid_if_configured(
+        self,
+        whatsapp_bot: LlmAgent,
+        attr: str,
+        expected_types: tuple[type, ...],
+        must_be_non_empty: bool,
+    ) -> None:
+        """Verify optional whatsapp_bot fields (if configured) are valid."""
+        # No getattr default: a renamed or misspelled field must fail loudly
+        value = getattr(whatsapp_bot, attr)
+
+        # Field is optional - if configured, should match the expected types
+        if value is not None:
+            assert isinstance(value, expected_types)
+            if must_be_non_empty:
+                assert callable(value) or value
+            # Sequence entries should be object instances
+            if isinstance(value, list):
+                assert all(item is not None for item in value)
@@ -1,11 +1,19 @@
 """Unit tests for prompt definition functions."""
 
+import importlib
+import logging
+import sys
 from datetime import date
 from unittest.mock import patch
 
+import pytest
 from conftest import MockReadonlyContext
 
 from whatsapp_bot.prompt import (
+    DESCRIPTION_ROOT,
+    INSTRUCTION_ROOT,
+    PROMPT_VERSION,
+    return_date_instruction,
     return_description_root,
     return_global_instruction,
     return_instruction_root,
@@ -39,6 +47,16 @@ class TestReturnDescriptionRoot:
 
         assert description1 == description2
 
+    def test_matches_module_constant(self) -> None:
+        """Test that the function returns the exported DESCRIPTION_ROOT constant."""
+        assert return_description_root() is DESCRIPTION_ROOT
+
+    def test_description_is_interned(self) -> None:
+        """Test that equal description strings resolve to the same object."""
+        rebuilt = "".join(list(DESCRIPTION_ROOT))
+
+        assert sys.intern(rebuilt) is DESCRIPTION_ROOT
+
 
 class TestReturnInstructionRoot:
     """Tests for return_instruction_root function."""
@@ -65,6 +83,18 @@ class TestReturnInstructionRoot:
 
         assert instruction1 == instruction2
 
+    def test_matches_module_constant(self) -> None:
+        """Test that the function returns the exported INSTRUCTION_ROOT constant."""
+        assert return_instruction_root() is INSTRUCTION_ROOT
+
+    def test_instruction_is_normalized(self) -> None:
+        """Test that instruction carries no whitespace padding into the prompt."""
+        instruction = return_instruction_root()
+
+        assert instruction == instruction.strip()
+        assert "\n\n\n" not in instruction
+        assert all(line == line.rstrip() for line in instruction.splitlines())
+
 
 class TestReturnGlobalInstruction:
     """Tests for return_global_instruction InstructionProvider function."""
@@ -78,45 +108,24 @@ class TestReturnGlobalInstruction:
         assert isinstance(instruction, str)
         assert len(instruction) > 0
 
-    def test_includes_current_date(
+    def test_excludes_current_date(
         self, mock_readonly_context: MockReadonlyContext
     ) -> None:
-        """Test that instruction includes today's date dynamically."""
+        """Test that the global instruction stays free of the volatile date."""
         instruction = return_global_instruction(mock_readonly_context)  # type: ignore
-        today = str(date.today())
 
-        assert today in instruction
-        assert "date" in instruction.lower()
+        assert str(date.today()) not in instruction
+        assert "date" not in instruction.lower()
 
     def test_includes_assistant_context(
         self, mock_readonly_context: MockReadonlyContext
     ) -> None:
-        """Test that instruction identifies role as helpful assistant."""
+        """Test that instruction identifies role as WhatsApp assistant."""
         instruction = return_global_instruction(mock_readonly_context)  # type: ignore
 
-        assert "helpful" in instruction.lower()
+        assert "whatsapp" in instruction.lower()
         assert "assistant" in instruction.lower()
 
-    def test_date_updates_dynamically(
-        self, mock_readonly_context: MockReadonlyContext
-    ) -> None:
-        """Test that date updates when function is called on different days."""
-        # Mock date.today() to return a specific date
-        with patch("whatsapp_bot.prompt.date") as mock_date:
-            mock_date.today.return_value = date(2025, 1, 15)
-            instruction1 = return_global_instruction(mock_readonly_context)  # type: ignore
-
-            # Verify first date
-            assert "2025-01-15" in instruction1
-
-            # Change the mocked date
-            mock_date.today.return_value = date(2025, 2, 20)
-            instruction2 = return_global_instruction(mock_readonly_context)  # type: ignore
-
-            # Verify second date
-            assert "2025-02-20" in instruction2
-            assert instruction1 != instruction2
-
     def test_accepts_readonly_context_parameter(self) -> None:
         """Test that function signature accepts ReadonlyContext as required by ADK."""
         # Create a context with state to ensure it's accessible if needed
@@ -157,16 +166,136 @@ class TestReturnGlobalInstruction:
         assert context1.state["user_tier"] == "premium"
         assert context2.state["user_tier"] == "free"
 
+    def test_instruction_is_stable_across_days(
+        self, mock_readonly_context: MockReadonlyContext
+    ) -> None:
+        """Test that the global instruction does not change when the date does."""
+        with patch("whatsapp_bot.prompt.date") as mock_date:
+            mock_date.today.return_value = date(2025, 1, 15)
+            instruction1 = return_global_instruction(mock_readonly_context)  # type: ignore
+
+            mock_date.today.return_value = date(2025, 2, 20)
+            instruction2 = return_global_instruction(mock_readonly_context)  # type: ignore
+
+        assert instruction1 == instruction2
+
+
+class TestReturnDateInstruction:
+    """Tests for return_date_instruction InstructionProvider function."""
+
+    def test_returns_string_with_context(
+        self, mock_readonly_context: MockReadonlyContext
+    ) -> None:
+        """Test that InstructionProvider returns a string when given ReadonlyContext."""
+        instruction = return_date_instruction(mock_readonly_context)  # type: ignore
+
+        assert isinstance(instruction, str)
+        assert len(instruction) > 0
+
+    def test_includes_current_date(
+        self, mock_readonly_context: MockReadonlyContext
+    ) -> None:
+        """Test that instruction includes today's date dynamically."""
+        instruction = return_date_instruction(mock_readonly_context)  # type: ignore
+        today = str(date.today())
+
+        assert today in instruction
+        assert "date" in instruction.lower()
+
+    def test_date_updates_dynamically(
+        self, mock_readonly_context: MockReadonlyContext
+    ) -> None:
+        """Test that date updates when function is called on different days."""
+        # Mock date.today() to return a specific date
+        with patch("whatsapp_bot.prompt.date") as mock_date:
+            mock_date.today.return_value = date(2025, 1, 15)
+            instruction1 = return_date_instruction(mock_readonly_context)  # type: ignore
+
+            # Verify first date
+            assert "2025-01-15" in instruction1
+
+            # Change the mocked date
+            mock_date.today.return_value = date(2025, 2, 20)
+            instruction2 = return_date_instruction(mock_readonly_context)  # type: ignore
+
+            # Verify second date
+            assert "2025-02-20" in instruction2
+            assert instruction1 != instruction2
+
     def test_instruction_format_consistency(
         self, mock_readonly_context: MockReadonlyContext
     ) -> None:
         """Test that instruction maintains consistent format across calls."""
-        instruction1 = return_global_instruction(mock_readonly_context)  # type: ignore
-        instruction2 = return_global_instruction(mock_readonly_context)  # type: ignore
+        instruction1 = return_date_instruction(mock_readonly_context)  # type: ignore
+        instruction2 = return_date_instruction(mock_readonly_context)  # type: ignore
 
         # Should be identical when called at same time (same date)
         assert instruction1 == instruction2
 
         # Should contain expected structure
-        assert "\n" in instruction1  # Multi-line format
-        assert "Today's date:" in instruction1
+        assert instruction1.startswith("Today's date:")
+
+    def test_instruction_is_cached_per_day(
+        self, mock_readonly_context: MockReadonlyContext
+    ) -> None:
+        """Test that the formatted instruction is reused within the same day."""
+        with patch("whatsapp_bot.prompt.date") as mock_date:
+            mock_date.today.return_value = date(2025, 3, 1)
+            instruction1 = return_date_instruction(mock_readonly_context)  # type: ignore
+            instruction2 = return_date_instruction(mock_readonly_context)  # type: ignore
+
+            # Same day returns the cached string object, not a rebuilt copy
+            assert instruction1 is instruction2
+
+            mock_date.today.return_value = date(2025, 3, 2)
+            instruction3 = return_date_instruction(mock_readonly_context)  # type: ignore
+
+            assert "2025-03-02" in instruction3
+            assert instruction3 is not instruction1
+
+
+class TestPromptVersion:
+    """Tests for the PROMPT_VERSION fingerprint."""
+
+    def test_is_short_hex_digest(self) -> None:
+        """Test that the version is an 8-character hex fingerprint."""
+        assert len(PROMPT_VERSION) == 8
+        int(PROMPT_VERSION, 16)
+
+    def test_logged_by_agent(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that the agent module logs the version when it builds the agent."""
+        caplog.set_level(logging.INFO, logger="whatsapp_bot.agent")
+
+        importlib.reload(importlib.import_module("whatsapp_bot.agent"))
+
+        assert f"Using prompt version: {PROMPT_VERSION}" in caplog.text
+
+    @pytest.mark.parametrize(
+        "text_source",
+        [
+            pytest.param("sys.intern", id="description"),
+            pytest.param("inspect.cleandoc", id="instruction"),
+        ],
+    )
+    def test_changes_when_prompt_text_changes(self, text_source: str) -> None:
+        """Test that editing a prompt text at import yields a new version.
+
+        Each patched function is the one the module routes that text through,
+        so reloading under the patch rebuilds the module with edited prompt text.
+        """
+        module_name, func_name = text_source.split(".")
+        original = getattr(importlib.import_module(module_name), func_name)
+        prompt = importlib.import_module("whatsapp_bot.prompt")
+
+        try:
+            with patch(
+                text_source,
+                side_effect=lambda text: original(text) + " Always reply in French.",
+            ):
+                importlib.reload(prompt)
+            edited_version = prompt.PROMPT_VERSION
+        finally:
+            importlib.reload(prompt)
+
+        assert edited_version != PROMPT_VERSION
+        assert prompt.PROMPT_VERSION == PROMPT_VERSION
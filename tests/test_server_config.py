@@ -1,15 +1,21 @@
 """Tests for server configuration."""
 
+import importlib
 import sys
 from collections.abc import Generator
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 
-@pytest.fixture
-def mock_dependencies() -> Generator[MagicMock]:
-    """Mock external dependencies to prevent side effects during import."""
+@pytest.fixture(scope="module")
+def fast_api_app_kwargs() -> Generator[dict[str, Any]]:
+    """Import the server once with mocked dependencies.
+
+    Yields:
+        Keyword arguments the server passed to get_fast_api_app.
+    """
     with (
         patch("google.adk.cli.fast_api.get_fast_api_app") as mock_get_app,
         patch("whatsapp_bot.utils.initialize_environment") as mock_init_env,
@@ -37,17 +43,20 @@ def mock_dependencies() -> Generator[MagicMock]:
 
         mock_init_env.return_value = mock_env
 
-        yield mock_get_app
-
+        # Re-run module-level setup if whatsapp_bot.server was already imported
+        if "whatsapp_bot.server" in sys.modules:
+            importlib.reload(sys.modules["whatsapp_bot.server"])
+        else:
+            importlib.import_module("whatsapp_bot.server")
 
-def test_server_session_db_kwargs_configuration(mock_dependencies: MagicMock) -> None:
-    """Verify session_db_kwargs is configured and passed to get_fast_api_app."""
-    # Ensure whatsapp_bot.server is reloaded if it was already imported
-    if "whatsapp_bot.server" in sys.modules:
-        del sys.modules["whatsapp_bot.server"]
+        mock_get_app.assert_called_once()
+        yield dict(mock_get_app.call_args.kwargs)
 
-    import whatsapp_bot.server  # noqa: F401
 
+def test_server_session_db_kwargs_configuration(
+    fast_api_app_kwargs: dict[str, Any],
+) -> None:
+    """Verify session_db_kwargs is configured and passed to get_fast_api_app."""
     # expected kwargs
     expected_db_kwargs = {
         "pool_pre_ping": True,
@@ -57,9 +66,5 @@ def test_server_session_db_kwargs_configuration(mock_dependencies: MagicMock) ->
         "pool_timeout": 30,
     }
 
-    # Verify the call
-    mock_dependencies.assert_called_once()
-    call_kwargs = mock_dependencies.call_args[1]
-
-    assert "session_db_kwargs" in call_kwargs
-    assert call_kwargs["session_db_kwargs"] == expected_db_kwargs
+    assert "session_db_kwargs" in fast_api_app_kwargs
+    assert fast_api_app_kwargs["session_db_kwargs"] == expected_db_kwargs